@@ -0,0 +1,68 @@
+"""The Airthings integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from airthings import Airthings, AirthingsDevice, AirthingsError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(minutes=6)
+MAX_SCAN_INTERVAL = timedelta(minutes=30)
+
+type AirthingsConfigEntry = ConfigEntry[AirthingsDataUpdateCoordinator]
+
+
+class AirthingsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AirthingsDevice]]):
+    """Class to manage fetching Airthings data."""
+
+    config_entry: AirthingsConfigEntry
+
+    def __init__(
+        self, hass: HomeAssistant, entry: AirthingsConfigEntry, airthings: Airthings
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+            always_update=False,
+        )
+        self.airthings = airthings
+        self._scheduled_refresh = False
+
+    async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
+        """Handle a refresh interval occurrence."""
+        self._scheduled_refresh = True
+        try:
+            await super()._handle_refresh_interval(_now)
+        finally:
+            self._scheduled_refresh = False
+
+    async def _async_update_data(self) -> dict[str, AirthingsDevice]:
+        """Get the latest data from Airthings."""
+        try:
+            devices: dict[str, AirthingsDevice] = await self.airthings.update_devices()
+        except AirthingsError as err:
+            self.update_interval = SCAN_INTERVAL
+            raise UpdateFailed(f"Unable to fetch data: {err}") from err
+
+        # The sensors of each device are the raw latest-samples payload,
+        # including its sample timestamp, so unchanged device data means no
+        # new sample. Only scheduled polls back off; manual refreshes keep
+        # the current interval, and any new sample resets it.
+        if devices != self.data:
+            self.update_interval = SCAN_INTERVAL
+        elif self._scheduled_refresh and self.update_interval:
+            self.update_interval = min(self.update_interval * 2, MAX_SCAN_INTERVAL)
+        return devices
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from airthings import AirthingsDevice
 
 from homeassistant.components.sensor import (
@@ -20,83 +23,86 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import AirthingsConfigEntry, AirthingsDataCoordinatorType
 from .const import DOMAIN
-
-SENSORS: dict[str, SensorEntityDescription] = {
-    "radonShortTermAvg": SensorEntityDescription(
-        key="radonShortTermAvg",
-        native_unit_of_measurement="Bq/m³",
-        translation_key="radon",
-    ),
-    "temp": SensorEntityDescription(
-        key="temp",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-    ),
-    "humidity": SensorEntityDescription(
-        key="humidity",
-        device_class=SensorDeviceClass.HUMIDITY,
-        native_unit_of_measurement=PERCENTAGE,
-    ),
-    "pressure": SensorEntityDescription(
-        key="pressure",
-        device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
-        native_unit_of_measurement=UnitOfPressure.MBAR,
-    ),
-    "battery": SensorEntityDescription(
-        key="battery",
-        device_class=SensorDeviceClass.BATTERY,
-        native_unit_of_measurement=PERCENTAGE,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    "co2": SensorEntityDescription(
-        key="co2",
-        device_class=SensorDeviceClass.CO2,
-        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-    ),
-    "voc": SensorEntityDescription(
-        key="voc",
-        device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
-        native_unit_of_measurement=CONCENTRATION_PARTS_PER_BILLION,
-    ),
-    "light": SensorEntityDescription(
-        key="light",
-        native_unit_of_measurement=PERCENTAGE,
-        translation_key="light",
-    ),
-    "virusRisk": SensorEntityDescription(
-        key="virusRisk",
-        translation_key="virus_risk",
-    ),
-    "mold": SensorEntityDescription(
-        key="mold",
-        translation_key="mold",
-    ),
-    "rssi": SensorEntityDescription(
-        key="rssi",
-        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS,
-        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-        entity_registry_enabled_default=False,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    "pm1": SensorEntityDescription(
-        key="pm1",
-        native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        device_class=SensorDeviceClass.PM1,
-    ),
-    "pm25": SensorEntityDescription(
-        key="pm25",
-        native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        device_class=SensorDeviceClass.PM25,
-    ),
-}
+from .coordinator import AirthingsConfigEntry, AirthingsDataUpdateCoordinator
+
+DASHBOARD_DEVICE_URL = "https://dashboard.airthings.com/devices/"
+
+SENSORS: Mapping[str, SensorEntityDescription] = MappingProxyType(
+    {
+        "radonShortTermAvg": SensorEntityDescription(
+            key="radonShortTermAvg",
+            native_unit_of_measurement="Bq/m³",
+            translation_key="radon",
+        ),
+        "temp": SensorEntityDescription(
+            key="temp",
+            device_class=SensorDeviceClass.TEMPERATURE,
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        ),
+        "humidity": SensorEntityDescription(
+            key="humidity",
+            device_class=SensorDeviceClass.HUMIDITY,
+            native_unit_of_measurement=PERCENTAGE,
+        ),
+        "pressure": SensorEntityDescription(
+            key="pressure",
+            device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
+            native_unit_of_measurement=UnitOfPressure.MBAR,
+        ),
+        "battery": SensorEntityDescription(
+            key="battery",
+            device_class=SensorDeviceClass.BATTERY,
+            native_unit_of_measurement=PERCENTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "co2": SensorEntityDescription(
+            key="co2",
+            device_class=SensorDeviceClass.CO2,
+            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+        ),
+        "voc": SensorEntityDescription(
+            key="voc",
+            device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
+            native_unit_of_measurement=CONCENTRATION_PARTS_PER_BILLION,
+        ),
+        "light": SensorEntityDescription(
+            key="light",
+            native_unit_of_measurement=PERCENTAGE,
+            translation_key="light",
+        ),
+        "virusRisk": SensorEntityDescription(
+            key="virusRisk",
+            translation_key="virus_risk",
+        ),
+        "mold": SensorEntityDescription(
+            key="mold",
+            translation_key="mold",
+        ),
+        "rssi": SensorEntityDescription(
+            key="rssi",
+            native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS,
+            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "pm1": SensorEntityDescription(
+            key="pm1",
+            native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            device_class=SensorDeviceClass.PM1,
+        ),
+        "pm25": SensorEntityDescription(
+            key="pm25",
+            native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+            device_class=SensorDeviceClass.PM25,
+        ),
+    }
+)
 
 
 async def async_setup_entry(
@@ -107,21 +113,32 @@ async def async_setup_entry(
     """Set up the Airthings sensor."""
 
     coordinator = entry.runtime_data
+    device_infos = {
+        device_id: DeviceInfo(
+            configuration_url=DASHBOARD_DEVICE_URL + airthings_device.device_id,
+            identifiers={(DOMAIN, airthings_device.device_id)},
+            name=airthings_device.name,
+            manufacturer="Airthings",
+            model=airthings_device.product_name,
+        )
+        for device_id, airthings_device in coordinator.data.items()
+    }
     entities = [
         AirthingsHeaterEnergySensor(
             coordinator,
             airthings_device,
-            SENSORS[sensor_types],
+            description,
+            device_infos[device_id],
         )
-        for airthings_device in coordinator.data.values()
-        for sensor_types in airthings_device.sensor_types
-        if sensor_types in SENSORS
+        for device_id, airthings_device in coordinator.data.items()
+        for sensor_type in airthings_device.sensor_types
+        if (description := SENSORS.get(sensor_type)) is not None
     ]
     async_add_entities(entities)
 
 
 class AirthingsHeaterEnergySensor(
-    CoordinatorEntity[AirthingsDataCoordinatorType], SensorEntity
+    CoordinatorEntity[AirthingsDataUpdateCoordinator], SensorEntity
 ):
     """Representation of a Airthings Sensor device."""
 
@@ -130,9 +147,10 @@ class AirthingsHeaterEnergySensor(
 
     def __init__(
         self,
-        coordinator: AirthingsDataCoordinatorType,
+        coordinator: AirthingsDataUpdateCoordinator,
         airthings_device: AirthingsDevice,
         entity_description: SensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -141,26 +159,24 @@ class AirthingsHeaterEnergySensor(
 
         self._attr_unique_id = f"{airthings_device.device_id}_{entity_description.key}"
         self._id = airthings_device.device_id
-        self._attr_device_info = DeviceInfo(
-            configuration_url=(
-                "https://dashboard.airthings.com/devices/"
-                f"{airthings_device.device_id}"
-            ),
-            identifiers={(DOMAIN, airthings_device.device_id)},
-            name=airthings_device.name,
-            manufacturer="Airthings",
-            model=airthings_device.product_name,
-        )
+        self._attr_device_info = device_info
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the value reported by the sensor."""
-        return self.coordinator.data[self._id].sensors[self.entity_description.key]  # type: ignore[no-any-return]
+        self._async_update_attrs()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the sensor value and availability from coordinator data."""
+        sensors = self.coordinator.data[self._id].sensors
+        self._sensor_available = self.entity_description.key in sensors
+        self._attr_native_value = sensors.get(self.entity_description.key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Check if device and sensor is available in data."""
-        return (
-            super().available
-            and self.entity_description.key in self.coordinator.data[self._id].sensors
-        )
+        return super().available and self._sensor_available
@@ -22,12 +22,14 @@ from .const import DOMAIN, MFCT_ID
 
 _LOGGER = logging.getLogger(__name__)
 
-SERVICE_UUIDS = [
-    "b42e1f6e-ade7-11e4-89d3-123b93f75cba",
-    "b42e4a8e-ade7-11e4-89d3-123b93f75cba",
-    "b42e1c08-ade7-11e4-89d3-123b93f75cba",
-    "b42e3882-ade7-11e4-89d3-123b93f75cba",
-]
+SERVICE_UUIDS = frozenset(
+    {
+        "b42e1f6e-ade7-11e4-89d3-123b93f75cba",
+        "b42e4a8e-ade7-11e4-89d3-123b93f75cba",
+        "b42e1c08-ade7-11e4-89d3-123b93f75cba",
+        "b42e3882-ade7-11e4-89d3-123b93f75cba",
+    }
+)
 
 
 @dataclasses.dataclass
@@ -146,14 +148,14 @@ class AirthingsConfigFlow(ConfigFlow, domain=DOMAIN):
 
         current_addresses = self._async_current_ids()
         for discovery_info in async_discovered_service_info(self.hass):
-            address = discovery_info.address
-            if address in current_addresses or address in self._discovered_devices:
+            if MFCT_ID not in discovery_info.manufacturer_data:
                 continue
 
-            if MFCT_ID not in discovery_info.manufacturer_data:
+            address = discovery_info.address
+            if address in current_addresses or address in self._discovered_devices:
                 continue
 
-            if not any(uuid in SERVICE_UUIDS for uuid in discovery_info.service_uuids):
+            if SERVICE_UUIDS.isdisjoint(discovery_info.service_uuids):
                 continue
 
             try:
@@ -0,0 +1,139 @@
+"""Test the Airthings integration setup."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from airthings import AirthingsDevice, AirthingsError
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.airthings.const import CONF_SECRET, DOMAIN
+from homeassistant.components.airthings.coordinator import (
+    MAX_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+)
+from homeassistant.const import CONF_ID
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+TEST_DATA = {
+    CONF_ID: "client_id",
+    CONF_SECRET: "secret",
+}
+
+
+def _devices(temperature: float) -> dict[str, AirthingsDevice]:
+    """Return a fresh device mapping as returned by the Airthings API."""
+    return {
+        "2960000001": AirthingsDevice(
+            device_id="2960000001",
+            name="Office",
+            sensors={"temp": temperature, "humidity": 40.0, "time": 1700000000},
+            is_active=True,
+            location_name="Home",
+            device_type="VIEW_PLUS",
+            product_name="View Plus",
+        )
+    }
+
+
+async def test_update_interval_backoff(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polling backs off on unchanged data and resets when it changes."""
+    temperature = 21.0
+
+    async def _update_devices() -> dict[str, AirthingsDevice]:
+        return _devices(temperature)
+
+    entry = MockConfigEntry(domain=DOMAIN, data=TEST_DATA)
+    entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.airthings.Airthings.update_devices",
+        side_effect=_update_devices,
+    ) as mock_update_devices:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = entry.runtime_data
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+        for expected in (
+            timedelta(minutes=12),
+            timedelta(minutes=24),
+            MAX_SCAN_INTERVAL,
+            MAX_SCAN_INTERVAL,
+        ):
+            freezer.tick(coordinator.update_interval)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+            assert coordinator.update_interval == expected
+
+        temperature = 22.0
+        freezer.tick(coordinator.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert mock_update_devices.call_count == 6
+    assert coordinator.update_interval == SCAN_INTERVAL
+    assert coordinator.data == _devices(22.0)
+
+
+async def test_update_interval_reset_on_error(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a failed poll resets a backed off interval."""
+    entry = MockConfigEntry(domain=DOMAIN, data=TEST_DATA)
+    entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.airthings.Airthings.update_devices",
+        side_effect=lambda: _devices(21.0),
+    ) as mock_update_devices:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = entry.runtime_data
+        for _ in range(2):
+            freezer.tick(coordinator.update_interval)
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+        assert coordinator.update_interval == timedelta(minutes=24)
+
+        mock_update_devices.side_effect = AirthingsError("Cloud unavailable")
+        freezer.tick(coordinator.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+
+async def test_manual_refresh_does_not_back_off(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test only scheduled polls back off the update interval."""
+    entry = MockConfigEntry(domain=DOMAIN, data=TEST_DATA)
+    entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.airthings.Airthings.update_devices",
+        side_effect=lambda: _devices(21.0),
+    ) as mock_update_devices:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = entry.runtime_data
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == SCAN_INTERVAL
+
+        freezer.tick(coordinator.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert coordinator.update_interval == timedelta(minutes=12)
+
+        await coordinator.async_refresh()
+
+    assert mock_update_devices.call_count == 4
+    assert coordinator.update_interval == timedelta(minutes=12)
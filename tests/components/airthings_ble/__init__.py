@@ -101,6 +101,27 @@ WAVE_SERVICE_INFO = BluetoothServiceInfoBleak(
     tx_power=0,
 )
 
+WAVE_2_SERVICE_INFO = BluetoothServiceInfoBleak(
+    name="dd-dd-dd-dd-dd-dd",
+    address="dd:dd:dd:dd:dd:dd",
+    device=generate_ble_device(
+        address="dd:dd:dd:dd:dd:dd",
+        name="Airthings Wave+",
+    ),
+    rssi=-70,
+    manufacturer_data={820: b"\xe4/\xa5\xae\t\x00"},
+    service_data={},
+    service_uuids=["b42e1c08-ade7-11e4-89d3-123b93f75cba"],
+    source="local",
+    advertisement=generate_advertisement_data(
+        manufacturer_data={820: b"\xe4/\xa5\xae\t\x00"},
+        service_uuids=["b42e1c08-ade7-11e4-89d3-123b93f75cba"],
+    ),
+    connectable=True,
+    time=0,
+    tx_power=0,
+)
+
 VIEW_PLUS_SERVICE_INFO = BluetoothServiceInfoBleak(
     name="cc-cc-cc-cc-cc-cc",
     address="cc:cc:cc:cc:cc:cc",
@@ -15,6 +15,7 @@ from homeassistant.data_entry_flow import FlowResultType
 from . import (
     UNKNOWN_SERVICE_INFO,
     VIEW_PLUS_SERVICE_INFO,
+    WAVE_2_SERVICE_INFO,
     WAVE_DEVICE_INFO,
     WAVE_SERVICE_INFO,
     patch_airthings_ble,
@@ -153,6 +154,82 @@ async def test_user_setup(hass: HomeAssistant) -> None:
     assert result["result"].unique_id == "cc:cc:cc:cc:cc:cc"
 
 
+async def test_user_setup_multiple_devices(hass: HomeAssistant) -> None:
+    """Test the user initiated form lists every discovered device."""
+    with (
+        patch(
+            "homeassistant.components.airthings_ble.config_flow.async_discovered_service_info",
+            return_value=[WAVE_SERVICE_INFO, WAVE_2_SERVICE_INFO],
+        ),
+        patch_async_ble_device_from_address(WAVE_SERVICE_INFO),
+        patch_airthings_ble(
+            side_effect=[
+                AirthingsDevice(
+                    manufacturer="Airthings AS",
+                    model=AirthingsDeviceType.WAVE_PLUS,
+                    name="Airthings Wave Plus",
+                    identifier="123456",
+                ),
+                AirthingsDevice(
+                    manufacturer="Airthings AS",
+                    model=AirthingsDeviceType.WAVE_PLUS,
+                    name="Airthings Wave Plus 2",
+                    identifier="654321",
+                ),
+            ]
+        ),
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": SOURCE_USER}
+        )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "user"
+    schema = result["data_schema"].schema
+
+    assert schema.get(CONF_ADDRESS).container == {
+        "cc:cc:cc:cc:cc:cc": "Airthings Wave Plus",
+        "dd:dd:dd:dd:dd:dd": "Airthings Wave Plus 2",
+    }
+
+    with patch_async_setup_entry():
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input={CONF_ADDRESS: "dd:dd:dd:dd:dd:dd"}
+        )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Airthings Wave Plus (654321)"
+    assert result["result"].unique_id == "dd:dd:dd:dd:dd:dd"
+
+
+async def test_user_setup_multiple_devices_one_failing(hass: HomeAssistant) -> None:
+    """Test the user initiated form aborts when one of several devices fails."""
+    with (
+        patch(
+            "homeassistant.components.airthings_ble.config_flow.async_discovered_service_info",
+            return_value=[WAVE_SERVICE_INFO, WAVE_2_SERVICE_INFO],
+        ),
+        patch_async_ble_device_from_address(WAVE_SERVICE_INFO),
+        patch_airthings_ble(
+            side_effect=[
+                AirthingsDevice(
+                    manufacturer="Airthings AS",
+                    model=AirthingsDeviceType.WAVE_PLUS,
+                    name="Airthings Wave Plus",
+                    identifier="123456",
+                ),
+                BleakError("An error"),
+            ]
+        ) as mock_update_device,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": SOURCE_USER}
+        )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "cannot_connect"
+    assert mock_update_device.call_count == 2
+
+
 async def test_user_setup_no_device(hass: HomeAssistant) -> None:
     """Test the user initiated form without any device detected."""
     with patch(